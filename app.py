@@ -3,16 +3,16 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
 import os
 import subprocess
 import time
-from hashlib import sha1
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import anyio
 import httpx
+import orjson
+import xxhash
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
@@ -35,7 +35,36 @@ WAIT_ACTIVE_TIMEOUT = 25
 WAIT_OUTPUTS_TIMEOUT = 20
 # -------------------------------------------
 
-app = FastAPI()
+@contextlib.asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # One pooled client for all Owntone traffic. /api/start fires many
+    # back-to-back PUTs, so give it headroom and let HTTP/2 multiplex
+    # them over a single connection when Owntone supports it.
+    app.state.http = httpx.AsyncClient(
+        base_url=OWNTONE_ENDPOINT,
+        timeout=httpx.Timeout(5.0, connect=1.0),
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=90.0),
+        http2=True,
+    )
+    app.state.dbus = await _dbus_connect()
+    # Dedicated limiter so concurrent systemctl calls (e.g. during start/stop)
+    # can't starve — or be starved by — other blocking work on the shared
+    # anyio worker pool.
+    app.state.sysctl_limiter = anyio.CapacityLimiter(8)
+    app.state.watch_task = asyncio.create_task(_watch_loop())
+    try:
+        yield
+    finally:
+        app.state.watch_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await app.state.watch_task
+        await app.state.http.aclose()
+        if app.state.dbus:
+            _dbus_units.clear()
+            with contextlib.suppress(Exception):
+                app.state.dbus.disconnect()
+
+app = FastAPI(lifespan=_lifespan)
 
 # ========== Static ==========
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
@@ -45,47 +74,58 @@ async def index():
     return FileResponse(STATIC_DIR / "index.html")
 
 # ========== SSE ==========
-_subscribers: List[asyncio.Queue] = []
+_subscribers: set[asyncio.Queue] = set()
 _sub_lock = asyncio.Lock()
+# Set while at least one SSE client is connected; the watcher sleeps on it
+# so an idle server does no systemd/Owntone polling at all.
+_active_evt = asyncio.Event()
 
 async def sse_subscribe() -> asyncio.Queue:
     q: asyncio.Queue = asyncio.Queue()
     async with _sub_lock:
-        _subscribers.append(q)
+        _subscribers.add(q)
+        _active_evt.set()
     return q
 
 async def sse_unsubscribe(q: asyncio.Queue):
     async with _sub_lock:
-        if q in _subscribers:
-            _subscribers.remove(q)
+        _subscribers.discard(q)
+        if not _subscribers:
+            _active_evt.clear()
+
+def _sse_frame(data: dict) -> str:
+    return f"data: {orjson.dumps(data).decode()}\n\n"
 
 async def sse_broadcast(payload: dict):
+    # Encode once, fan out the same pre-framed string to every subscriber.
+    # Collect dead queues during the (await-free) send loop and drop them
+    # under a single lock acquisition afterwards.
+    frame = _sse_frame(payload)
     async with _sub_lock:
         qs = list(_subscribers)
+    dead = []
     for q in qs:
         try:
-            q.put_nowait(payload)
+            q.put_nowait(frame)
         except Exception:
-            await sse_unsubscribe(q)
-
-def _sse_event(data: dict) -> str:
-    return f"data: {json.dumps(data)}\n\n"
+            dead.append(q)
+    if dead:
+        async with _sub_lock:
+            for q in dead:
+                _subscribers.discard(q)
+            if not _subscribers:
+                _active_evt.clear()
 
 @app.get("/api/events")
 async def events(request: Request):
     q = await sse_subscribe()
     try:
-        core = await _is_active_async(CORE_SERVICE)
-        pipe = await _is_active_async(PIPE_SERVICE)
-        await q.put({"type": "status", "core_active": core, "pipe_active": pipe, "both_active": core and pipe})
+        active = await _are_active_async(CORE_SERVICE, PIPE_SERVICE)
+        core, pipe = active[CORE_SERVICE], active[PIPE_SERVICE]
+        await q.put(_sse_frame({"type": "status", "core_active": core, "pipe_active": pipe, "both_active": core and pipe}))
         if core and pipe:
-            outs = await _list_outputs_raw()
-            defaults = _read_defaults_map()
-            for o in outs:
-                oid = str(int(o.get("id")))
-                o["default"] = oid in defaults
-                o["default_volume"] = defaults.get(oid)
-            await q.put({"type": "outputs", "outputs": outs})
+            outs = _attach_defaults(await _list_outputs_cached())
+            await q.put(_sse_frame({"type": "outputs", "outputs": outs}))
     except Exception:
         pass
 
@@ -94,55 +134,139 @@ async def events(request: Request):
             while True:
                 if await request.is_disconnected():
                     break
-                msg = await q.get()
-                yield _sse_event(msg)
+                yield await q.get()
         finally:
             await sse_unsubscribe(q)
 
     return StreamingResponse(gen(), media_type="text/event-stream")
 
 # ========== Defaults persistence ==========
+# (st_mtime_ns, parsed map) — avoids re-reading/parsing the file on every
+# request and watcher tick; a single stat() suffices when unchanged.
+_defaults_cache: Optional[tuple] = None
+
 def _read_defaults_map() -> Dict[str, int]:
     """
     Returns dict of {"<output_id>": default_volume_int}
     Supports migration from legacy list format.
     """
-    if DEFAULTS_FILE.exists():
-        try:
-            data = json.loads(DEFAULTS_FILE.read_text())
-            if isinstance(data, dict):
-                # Validate values
-                out = {}
-                for k, v in data.items():
-                    try:
-                        out[str(int(k))] = max(0, min(100, int(v)))
-                    except Exception:
-                        pass
-                return out
-            if isinstance(data, list):
-                # legacy: list of ids -> default vol 50
-                return {str(int(x)): 50 for x in data}
-        except Exception:
-            pass
-    return {}
+    global _defaults_cache
+    try:
+        st = os.stat(DEFAULTS_FILE)
+    except FileNotFoundError:
+        _defaults_cache = None
+        return {}
+    if _defaults_cache is not None and _defaults_cache[0] == st.st_mtime_ns:
+        # Copy so callers (update_output mutates the result before writing)
+        # can't desync the cache from the on-disk file.
+        return dict(_defaults_cache[1])
+    try:
+        data = orjson.loads(DEFAULTS_FILE.read_bytes())
+        if isinstance(data, dict):
+            # Validate values
+            out = {}
+            for k, v in data.items():
+                try:
+                    out[str(int(k))] = max(0, min(100, int(v)))
+                except Exception:
+                    pass
+        elif isinstance(data, list):
+            # legacy: list of ids -> default vol 50
+            out = {str(int(x)): 50 for x in data}
+        else:
+            out = {}
+    except Exception:
+        return {}
+    _defaults_cache = (st.st_mtime_ns, out)
+    return dict(out)
 
-def _write_defaults_map(m: Dict[str, int]) -> None:
+async def _write_defaults_map(m: Dict[str, int]) -> Dict[str, int]:
+    global _defaults_cache
     # Clean + clamp
     cleaned = {str(int(k)): max(0, min(100, int(v))) for k, v in m.items()}
-    DEFAULTS_FILE.write_text(json.dumps(cleaned, indent=2, sort_keys=True), encoding="utf-8")
+    payload = orjson.dumps(cleaned, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+
+    def _do_write() -> int:
+        # temp file + rename so a crash can't leave a truncated JSON behind
+        tmp = DEFAULTS_FILE.with_suffix(".json.tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, DEFAULTS_FILE)
+        return os.stat(DEFAULTS_FILE).st_mtime_ns
+
+    mtime_ns = await anyio.to_thread.run_sync(_do_write)
+    _defaults_cache = (mtime_ns, cleaned)
+    return cleaned
+
+_MISSING = object()
+
+def _attach_defaults(outs: List[Dict], defs: Optional[Dict[str, int]] = None) -> List[Dict]:
+    """Annotate each output with its default flag/volume (one lookup per output)."""
+    if defs is None:
+        defs = _read_defaults_map()
+    for o in outs:
+        v = defs.get(str(o.get("id")), _MISSING)
+        o["default"] = v is not _MISSING
+        o["default_volume"] = None if v is _MISSING else v
+    return outs
 
 # ========== Systemd (async via thread) ==========
+# Fast path: one persistent D-Bus connection to systemd instead of a
+# systemctl fork/exec per activity check. start/stop stay on systemctl
+# (cold path). Falls back to subprocess when the bus is unavailable.
+try:
+    from dbus_fast import BusType
+    from dbus_fast.aio import MessageBus
+except ImportError:
+    MessageBus = None
+
+_SYSTEMD_BUS = "org.freedesktop.systemd1"
+_dbus_units: Dict[str, object] = {}
+
+async def _dbus_connect():
+    """Connect to the system bus and resolve Unit interfaces for our services."""
+    if MessageBus is None:
+        return None
+    try:
+        bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+        intro = await bus.introspect(_SYSTEMD_BUS, "/org/freedesktop/systemd1")
+        manager = bus.get_proxy_object(_SYSTEMD_BUS, "/org/freedesktop/systemd1", intro) \
+                     .get_interface("org.freedesktop.systemd1.Manager")
+        for unit in (CORE_SERVICE, PIPE_SERVICE):
+            path = await manager.call_load_unit(unit)
+            unit_intro = await bus.introspect(_SYSTEMD_BUS, path)
+            obj = bus.get_proxy_object(_SYSTEMD_BUS, path, unit_intro)
+            _dbus_units[unit] = obj.get_interface("org.freedesktop.systemd1.Unit")
+        return bus
+    except Exception:
+        _dbus_units.clear()
+        return None
+
 async def _run_systemctl(*args: str) -> subprocess.CompletedProcess:
     def _run():
         return subprocess.run(
             ["/bin/systemctl", *args],
             stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=False
         )
-    return await anyio.to_thread.run_sync(_run)
+    limiter = getattr(app.state, "sysctl_limiter", None)
+    return await anyio.to_thread.run_sync(_run, limiter=limiter)
+
+async def _are_active_async(*units: str) -> Dict[str, bool]:
+    if _dbus_units and all(u in _dbus_units for u in units):
+        try:
+            states = await asyncio.gather(*(_dbus_units[u].get_active_state() for u in units))
+            return {u: s == "active" for u, s in zip(units, states)}
+        except Exception:
+            # bus gone away — drop the fast path so later checks go straight
+            # to systemctl instead of paying a failing round-trip each time
+            _dbus_units.clear()
+    # `systemctl is-active` accepts multiple units and reports one state per
+    # line, so both services cost a single fork/exec.
+    p = await _run_systemctl("is-active", "--", *units)
+    lines = p.stdout.splitlines()
+    return {u: (i < len(lines) and lines[i].strip() == "active") for i, u in enumerate(units)}
 
 async def _is_active_async(unit: str) -> bool:
-    p = await _run_systemctl("is-active", unit)
-    return p.returncode == 0 and p.stdout.strip() == "active"
+    return (await _are_active_async(unit))[unit]
 
 async def _wait_active_async(unit: str, timeout_s: int) -> bool:
     deadline = time.monotonic() + timeout_s
@@ -156,55 +280,95 @@ async def _wait_active_async(unit: str, timeout_s: int) -> bool:
 def _http() -> httpx.AsyncClient:
     return app.state.http
 
+# orjson on the raw bytes: r.json() would decode the body to str first and
+# then parse it — doubled work for the /outputs list the watcher fetches
+# constantly.
 async def _owntone_get(path: str) -> Dict:
     r = await _http().get(path)
     r.raise_for_status()
-    return r.json()
+    return orjson.loads(r.content)
 
 async def _owntone_put(path: str, payload: Dict) -> Dict:
     r = await _http().put(path, json=payload)
     r.raise_for_status()
-    return r.json() if r.headers.get("content-length") not in (None, "0") else {}
+    return orjson.loads(r.content) if r.content else {}
 
 async def _owntone_post(path: str, payload: Optional[Dict] = None) -> Dict:
     r = await _http().post(path, json=payload or {})
     r.raise_for_status()
-    return r.json() if r.headers.get("content-length") not in (None, "0") else {}
+    return orjson.loads(r.content) if r.content else {}
+
+def _normalize_outputs(outs: List[Dict]) -> List[Dict]:
+    # Canonicalize ids to their string form once on ingest; the attach/
+    # fingerprint/lookup hot loops then use them directly instead of
+    # re-running str(int()) per pass. Owntone ids are uint64 sent as JSON
+    # strings — keep them strings on the wire so values above 2^53 survive
+    # the browser's JSON.parse.
+    for o in outs:
+        try:
+            o["id"] = str(int(o["id"]))
+        except Exception:
+            pass
+    return outs
 
 async def _list_outputs_raw() -> List[Dict]:
     data = await _owntone_get("/outputs")
-    return data.get("outputs", []) if isinstance(data, dict) else []
-
-def _outputs_fp(outs: List[Dict]) -> str:
-    minimal = [
-        {
-            "id": int(o.get("id")),
-            "selected": bool(o.get("selected", False)),
-            "volume": int(o.get("volume", 0)),
-            "name": str(o.get("name", "")),
-        }
-        for o in sorted(outs, key=lambda x: int(x.get("id", 0)))
-    ]
-    return sha1(json.dumps(minimal, sort_keys=True).encode()).hexdigest()
+    return _normalize_outputs(data.get("outputs", [])) if isinstance(data, dict) else []
+
+# Short-TTL cache with single-flight coalescing: with several UI clients a
+# change triggers a burst of identical /outputs GETs within milliseconds —
+# collapse them into one upstream call.
+_outs_cache: Dict = {"ts": 0.0, "data": [], "task": None}
+
+# Last outputs list seen by the watcher; lets update_output broadcast a
+# locally patched snapshot instead of re-fetching from Owntone.
+_last_outs: List[Dict] = []
+
+def _invalidate_outputs_cache() -> None:
+    _outs_cache["ts"] = 0.0
+
+async def _list_outputs_cached(max_age: float = 0.5) -> List[Dict]:
+    if time.monotonic() - _outs_cache["ts"] < max_age:
+        return _outs_cache["data"]
+    task = _outs_cache["task"]
+    if task is None:
+        async def _refresh():
+            try:
+                data = await _list_outputs_raw()
+                _outs_cache["data"] = data
+                _outs_cache["ts"] = time.monotonic()
+                return data
+            finally:
+                _outs_cache["task"] = None
+        task = _outs_cache["task"] = asyncio.create_task(_refresh())
+    return await task
+
+def _outputs_fp(outs: List[Dict]) -> int:
+    # Change detection only, so a fast non-cryptographic hash over the fields
+    # the UI cares about is enough — no JSON round-trip, no SHA-1.
+    h = xxhash.xxh3_64()
+    for o in sorted(outs, key=lambda x: x.get("id", "")):
+        h.update(
+            f"{o.get('id')}\x00{int(bool(o.get('selected', False)))}\x00"
+            f"{int(o.get('volume', 0))}\x00{o.get('name', '')}\x00".encode()
+        )
+    return h.intdigest()
 
 # ========== API: status / outputs ==========
 @app.get("/api/status")
 async def status():
-    core = await _is_active_async(CORE_SERVICE)
-    pipe = await _is_active_async(PIPE_SERVICE)
+    active = await _are_active_async(CORE_SERVICE, PIPE_SERVICE)
+    core, pipe = active[CORE_SERVICE], active[PIPE_SERVICE]
     return {"core_active": core, "pipe_active": pipe, "both_active": core and pipe}
 
 @app.get("/api/outputs")
 async def outputs():
     defaults = _read_defaults_map()
-    outs = await _list_outputs_raw()
+    outs = await _list_outputs_cached()
     for o in outs:
-        oid = str(int(o.get("id")))
         o.setdefault("volume", 0)
         o.setdefault("selected", False)
-        o["default"] = oid in defaults
-        o["default_volume"] = defaults.get(oid)
-    return {"outputs": outs}
+    return {"outputs": _attach_defaults(outs, defaults)}
 
 @app.put("/api/outputs/{out_id}")
 async def update_output(out_id: int, body: Dict):
@@ -221,8 +385,8 @@ async def update_output(out_id: int, body: Dict):
             else:
                 # if current output volume known, use it; else 50
                 try:
-                    outs = await _list_outputs_raw()
-                    cur = next((o for o in outs if str(int(o.get("id"))) == oid), None)
+                    outs = await _list_outputs_cached()
+                    cur = next((o for o in outs if str(o.get("id")) == oid), None)
                     defaults[oid] = max(0, min(100, int(cur.get("volume", 50)))) if cur else 50
                 except Exception:
                     defaults[oid] = 50
@@ -236,28 +400,39 @@ async def update_output(out_id: int, body: Dict):
         touch_defaults = True
 
     if touch_defaults:
-        _write_defaults_map(defaults)
-
-    # forward live selection/volume to Owntone if present
-    if "selected" in body or "volume" in body:
+        defaults = await _write_defaults_map(defaults)
+
+    # forward live selection/volume to Owntone if present (merged payload,
+    # one PUT instead of two)
+    payload: Dict = {}
+    if "selected" in body:
+        payload["selected"] = bool(body["selected"])
+    if "volume" in body:
         try:
-            if "selected" in body:
-                await _owntone_put(f"/outputs/{out_id}", {"selected": bool(body["selected"])})
-            if "volume" in body:
-                v = int(body["volume"])
-                await _owntone_put(f"/outputs/{out_id}", {"volume": max(0, min(100, v))})
+            payload["volume"] = max(0, min(100, int(body["volume"])))
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="volume must be an integer 0-100")
+    if payload:
+        try:
+            await _owntone_put(f"/outputs/{out_id}", payload)
+            _invalidate_outputs_cache()
         except Exception as e:
             raise HTTPException(status_code=502, detail=f"Owntone update failed: {e}")
 
-    # push updated outputs (with default flags/volumes)
+    # push updated outputs (with default flags/volumes). The applied change
+    # is known, so patch the last watcher snapshot locally when we have one
+    # and skip the round-trip; the watcher reconciles within POLL_SEC.
     try:
-        outs = await _list_outputs_raw()
-        defs = _read_defaults_map()
-        for o in outs:
-            k = str(int(o.get("id")))
-            o["default"] = k in defs
-            o["default_volume"] = defs.get(k)
-        await sse_broadcast({"type": "outputs", "outputs": outs})
+        if _last_outs:
+            outs = [dict(o) for o in _last_outs]
+            if payload:
+                cur = next((o for o in outs if str(o.get("id")) == oid), None)
+                if cur:
+                    cur.update(payload)
+        else:
+            outs = await _list_outputs_cached()
+        # defaults is already the cleaned, persisted map
+        await sse_broadcast({"type": "outputs", "outputs": _attach_defaults(outs, defaults)})
     except Exception:
         pass
 
@@ -274,15 +449,10 @@ async def set_defaults(body: Dict):
     defaults = body.get("defaults")
     if not isinstance(defaults, dict):
         raise HTTPException(status_code=400, detail="Expected body { defaults: {id: volume, ...} }")
-    _write_defaults_map(defaults)
+    defs = await _write_defaults_map(defaults)
 
     try:
-        outs = await _list_outputs_raw()
-        defs = _read_defaults_map()
-        for o in outs:
-            k = str(int(o.get("id")))
-            o["default"] = k in defs
-            o["default_volume"] = defs.get(k)
+        outs = _attach_defaults(await _list_outputs_cached(), defs)
         await sse_broadcast({"type": "outputs", "outputs": outs})
     except Exception:
         pass
@@ -294,7 +464,9 @@ async def set_defaults(body: Dict):
 async def start():
     await _run_systemctl("start", CORE_SERVICE)
     if not await _wait_active_async(CORE_SERVICE, WAIT_ACTIVE_TIMEOUT):
-        await sse_broadcast({"type": "status", "core_active": False, "pipe_active": await _is_active_async(PIPE_SERVICE), "both_active": False})
+        # core never came up, so both_active is False regardless of the pipe —
+        # no point forking another status check on the failure path
+        await sse_broadcast({"type": "status", "core_active": False, "pipe_active": False, "both_active": False})
         return JSONResponse({"ok": False, "error": "owntone.service failed to start"}, status_code=500)
 
     await _run_systemctl("start", PIPE_SERVICE)
@@ -320,26 +492,35 @@ async def start():
         await sse_broadcast({"type": "status", "core_active": False, "pipe_active": False, "both_active": False})
         return JSONResponse({"ok": False, "error": "no outputs discovered"}, status_code=500)
 
-    # enable defaults: set volume first, then select
+    # enable defaults: volume first, then select — ordered per output, but
+    # independent outputs run concurrently
     defs = _read_defaults_map()
-    try:
-        for o in outs:
-            k = str(int(o.get("id")))
-            if k in defs:
-                dv = max(0, min(100, int(defs[k])))
-                await _owntone_put(f"/outputs/{k}", {"volume": dv})
-                await _owntone_put(f"/outputs/{k}", {"selected": True})
-    except Exception as e:
+
+    async def _enable(k: str, dv: int):
+        try:
+            await _owntone_put(f"/outputs/{k}", {"volume": dv, "selected": True})
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code >= 500:
+                raise
+            # Owntone rejected the merged payload — fall back to two PUTs
+            await _owntone_put(f"/outputs/{k}", {"volume": dv})
+            await _owntone_put(f"/outputs/{k}", {"selected": True})
+
+    targets = [
+        (k, max(0, min(100, int(defs[k]))))
+        for o in outs
+        if (k := str(o.get("id"))) in defs
+    ]
+    results = await asyncio.gather(*(_enable(k, dv) for k, dv in targets), return_exceptions=True)
+    err = next((r for r in results if isinstance(r, BaseException)), None)
+    if err is not None:
         await _run_systemctl("stop", CORE_SERVICE)
         await sse_broadcast({"type": "status", "core_active": False, "pipe_active": False, "both_active": False})
-        return JSONResponse({"ok": False, "error": f"failed to enable defaults: {e}"}, status_code=500)
+        return JSONResponse({"ok": False, "error": f"failed to enable defaults: {err}"}, status_code=500)
 
     # broadcast fresh state
     try:
-        for o in outs:
-            k = str(int(o.get("id")))
-            o["default"] = k in defs
-            o["default_volume"] = defs.get(k)
+        _attach_defaults(outs, defs)
         await sse_broadcast({"type": "status", "core_active": True, "pipe_active": True, "both_active": True})
         await sse_broadcast({"type": "outputs", "outputs": outs})
     except Exception:
@@ -351,36 +532,32 @@ async def start():
 async def stop():
     await _run_systemctl("stop", CORE_SERVICE)
     await asyncio.sleep(0.5)
-    core = await _is_active_async(CORE_SERVICE)
-    pipe = await _is_active_async(PIPE_SERVICE)
+    active = await _are_active_async(CORE_SERVICE, PIPE_SERVICE)
+    core, pipe = active[CORE_SERVICE], active[PIPE_SERVICE]
     await sse_broadcast({"type": "status", "core_active": core, "pipe_active": pipe, "both_active": core and pipe})
     if not (core and pipe):
         await sse_broadcast({"type": "outputs", "outputs": []})
     return {"ok": True, "core_active": core, "pipe_active": pipe}
 
 # ========== Watcher ==========
-def _attach_defaults(outs: List[Dict]) -> List[Dict]:
-    defs = _read_defaults_map()
-    for o in outs:
-        k = str(int(o.get("id")))
-        o["default"] = k in defs
-        o["default_volume"] = defs.get(k)
-    return outs
-
 async def _watch_loop():
+    global _last_outs
     prev_status = None
     prev_fp = None
     while True:
+        # No subscribers, no polling — wake up when the first client connects.
+        await _active_evt.wait()
         try:
-            core = await _is_active_async(CORE_SERVICE)
-            pipe = await _is_active_async(PIPE_SERVICE)
+            active = await _are_active_async(CORE_SERVICE, PIPE_SERVICE)
+            core, pipe = active[CORE_SERVICE], active[PIPE_SERVICE]
             status_now = {"core_active": core, "pipe_active": pipe, "both_active": core and pipe}
             if status_now != prev_status:
                 prev_status = status_now
                 await sse_broadcast({"type": "status", **status_now})
 
             if status_now["both_active"]:
-                outs = _attach_defaults(await _list_outputs_raw())
+                outs = _attach_defaults(await _list_outputs_cached())
+                _last_outs = outs
                 fp = _outputs_fp(outs)
                 if fp != prev_fp:
                     prev_fp = fp
@@ -388,23 +565,9 @@ async def _watch_loop():
             else:
                 if prev_fp is not None:
                     prev_fp = None
+                    _last_outs = []
                     await sse_broadcast({"type": "outputs", "outputs": []})
         except Exception:
             pass
         await asyncio.sleep(POLL_SEC)
 
-@app.on_event("startup")
-async def _startup():
-    app.state.http = httpx.AsyncClient(base_url=OWNTONE_ENDPOINT, timeout=5.0)
-    app.state.watch_task = asyncio.create_task(_watch_loop())
-
-@app.on_event("shutdown")
-async def _shutdown():
-    task: asyncio.Task = getattr(app.state, "watch_task", None)
-    if task:
-        task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
-            await task
-    client: httpx.AsyncClient = getattr(app.state, "http", None)
-    if client:
-        await client.aclose()
@@ -1,4 +1,6 @@
 #!/usr/bin/env python3
+import atexit
+import json
 import os
 import time
 import httpx
@@ -32,35 +34,79 @@ class RecordPlayerMain(Accessory):
         serv_switch = self.add_preload_service("Switch")
         # setter must be sync for HAP-python; no coroutine here
         self.char_on = serv_switch.configure_char("On", setter_callback=self.set_on)
-        # sync client to avoid event loop requirements
-        self._client = httpx.Client(timeout=HTTP_TIMEOUT)
+        # sync client to avoid event loop requirements; shared between the
+        # HAP setter thread and the polling thread, with keep-alive so the
+        # every-5-second poll reuses one TCP connection to the backend
+        self._client = httpx.Client(
+            base_url=BACKEND_ENDPOINT,
+            timeout=HTTP_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+            transport=httpx.HTTPTransport(retries=1),
+        )
+        atexit.register(self._client.close)
 
     # Toggle via backend
     def set_on(self, value):
         try:
             if value:
-                self._client.post(f"{BACKEND_ENDPOINT}/start")
+                self._client.post("/start")
             else:
-                self._client.post(f"{BACKEND_ENDPOINT}/stop")
+                self._client.post("/stop")
         except Exception as e:
             print(f"[ERROR] Backend call failed: {e}")
 
-    # Poll backend and reflect state in the characteristic
+    def _apply_status(self, data):
+        # Use the field names from your backend
+        state = bool(data.get("both_active")) or (
+            bool(data.get("owntone_active")) and bool(data.get("pipe_active"))
+        )
+        if state != self.char_on.value:
+            self.char_on.set_value(state)
+
+    def _consume_events(self):
+        # The backend only pushes on change, so a quiet stream routinely hits
+        # the read timeout; run() reconnects silently. Keep it short-ish so
+        # shutdown never blocks long inside iter_lines.
+        timeout = httpx.Timeout(HTTP_TIMEOUT, read=15.0)
+        with self._client.stream("GET", "/events", timeout=timeout) as r:
+            r.raise_for_status()
+            for line in r.iter_lines():
+                if self.driver.stop_event.is_set():
+                    return
+                if not line.startswith("data:"):
+                    continue
+                try:
+                    msg = json.loads(line[5:].strip())
+                except ValueError:
+                    continue
+                if msg.get("type") == "status":
+                    self._apply_status(msg)
+
+    def _poll_once(self):
+        try:
+            r = self._client.get("/status")
+            if r.is_success:
+                self._apply_status(r.json())
+        except Exception as e:
+            print(f"[WARN] Status poll failed: {e}")
+
+    # Reflect backend state in the characteristic, event-driven via the
+    # backend's SSE stream instead of a fixed 5 s poll.
     # NOTE: HAP-python runs this in an accessory thread; keep it sync
     def run(self):
         while not self.driver.stop_event.is_set():
             try:
-                r = self._client.get(f"{BACKEND_ENDPOINT}/status")
-                if r.is_success:
-                    data = r.json()
-                    # Use the field names from your backend
-                    state = bool(data.get("both_active")) or (
-                        bool(data.get("owntone_active")) and bool(data.get("pipe_active"))
-                    )
-                    if state != self.char_on.value:
-                        self.char_on.set_value(state)
+                self._consume_events()
+            except httpx.ReadTimeout:
+                # expected on an idle stream — reconnect without logging or
+                # falling back to a poll
+                continue
             except Exception as e:
-                print(f"[WARN] Status poll failed: {e}")
+                print(f"[WARN] Event stream failed: {e}")
+            if self.driver.stop_event.is_set():
+                break
+            # fall back to one poll, then try the stream again
+            self._poll_once()
             time.sleep(POLL_INTERVAL)
 
 